@@ -0,0 +1,86 @@
+"""Benchmark per-test driver setup cost: fresh browser vs pooled browser with reset.
+
+Usage:
+    python -m benchmarks.bench_driver_setup --browser chrome --iterations 10
+"""
+import argparse
+import json
+import statistics
+import time
+from config import Config
+from utils.driver_factory import create_driver
+from utils.driver_pool import DriverPool
+
+
+def dirty_state(driver, url):
+    """Leave behind the kind of state a real test does"""
+    driver.get(url)
+    driver.add_cookie({"name": "bench", "value": "1"})
+    driver.execute_script("window.localStorage.setItem('bench', '1');")
+    driver.execute_script("window.open('about:blank');")
+
+
+def bench_fresh(browser, url, iterations):
+    """Time launch + quit of a new browser per test"""
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        driver = create_driver(browser)
+        setup = time.perf_counter() - start
+        dirty_state(driver, url)
+        start = time.perf_counter()
+        driver.quit()
+        timings.append(setup + time.perf_counter() - start)
+    return timings
+
+
+def bench_pooled(browser, url, iterations):
+    """Time acquire + reset/release of a warm browser per test"""
+    pool = DriverPool(lambda: create_driver(browser))
+    pool.release(pool.acquire())  # warm-up launch is a one-off session cost
+    timings = []
+    try:
+        for _ in range(iterations):
+            start = time.perf_counter()
+            driver = pool.acquire()
+            setup = time.perf_counter() - start
+            dirty_state(driver, url)
+            start = time.perf_counter()
+            pool.release(driver)
+            timings.append(setup + time.perf_counter() - start)
+    finally:
+        pool.close()
+    return timings, pool.stats
+
+
+def summarize(timings):
+    return {
+        "mean_s": round(statistics.mean(timings), 4),
+        "median_s": round(statistics.median(timings), 4),
+        "max_s": round(max(timings), 4),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--browser", default=Config.BROWSER)
+    parser.add_argument("--url", default=Config.BASE_URL)
+    parser.add_argument("--iterations", type=int, default=10)
+    args = parser.parse_args()
+
+    fresh = bench_fresh(args.browser, args.url, args.iterations)
+    pooled, stats = bench_pooled(args.browser, args.url, args.iterations)
+
+    result = {
+        "browser": args.browser,
+        "iterations": args.iterations,
+        "fresh": summarize(fresh),
+        "pooled": summarize(pooled),
+        "pool_stats": stats,
+        "speedup": round(statistics.mean(fresh) / statistics.mean(pooled), 2),
+    }
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,11 @@
+import os
+
+
 class Config:
     BASE_URL = "https://the-internet.herokuapp.com"
     TIMEOUT = 10
     USERNAME = "admin"
     PASSWORD = "admin"
-    BROWSER = "chrome"
\ No newline at end of file
+    BROWSER = "chrome"
+    # "fresh" launches a browser per test, "pooled" reuses warm browsers
+    DRIVER_MODE = os.getenv("DRIVER_MODE", "fresh")
@@ -1,11 +1,14 @@
 # conftest.py - WITH CROSS-BROWSER SUPPORT
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
 import os
+import shutil
+import tempfile
 from datetime import datetime
 import allure
+from config import Config
+from utils.driver_factory import create_driver
+from utils.driver_pool import DriverPool
+from utils.parallel import get_worker_id, is_worker, worker_dir, merge_worker_results
 
 
 def pytest_addoption(parser):
@@ -16,6 +19,50 @@ def pytest_addoption(parser):
         default="chrome",
         help="Browser to run tests on: chrome or firefox"
     )
+    parser.addoption(
+        "--driver-mode",
+        action="store",
+        default=Config.DRIVER_MODE,
+        choices=["fresh", "pooled"],
+        help="fresh: new browser per test, pooled: reuse warm browsers per session/worker"
+    )
+    parser.addoption(
+        "--workers",
+        action="store",
+        default=None,
+        help="Run test classes in parallel worker processes: a number or 'auto' (needs pytest-xdist)"
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_cmdline_main(config):
+    """Translate --workers into pytest-xdist options, one test class per worker at a time"""
+    workers = config.getoption("--workers")
+    if workers is None:
+        return
+    if not config.pluginmanager.hasplugin("xdist"):
+        raise pytest.UsageError("--workers requires pytest-xdist (pip install pytest-xdist)")
+
+    config.option.numprocesses = workers if workers == "auto" else int(workers)
+    if config.option.dist == "no":
+        config.option.dist = "loadscope"
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    """Give every xdist worker its own Allure results directory"""
+    report_dir = getattr(config.option, "allure_report_dir", None)
+    if report_dir and is_worker(config):
+        # Only the controller may wipe the results directory
+        config.option.clean_alluredir = False
+        config.option.allure_report_dir = os.path.join(report_dir, get_worker_id(config))
+
+
+def pytest_sessionfinish(session):
+    """Merge per-worker Allure results once all workers are done"""
+    report_dir = getattr(session.config.option, "allure_report_dir", None)
+    if report_dir and not is_worker(session.config):
+        merge_worker_results(report_dir)
 
 
 @pytest.fixture
@@ -24,41 +71,50 @@ def browser_name(request):
     return request.config.getoption("--browser")
 
 
+@pytest.fixture(scope="session")
+def driver_pool(request):
+    """Session (per xdist worker) pool of warm browsers"""
+    browser = request.config.getoption("--browser")
+    pool = DriverPool(lambda: create_driver(browser))
+    yield pool
+    pool.close()
+
+
 @pytest.fixture
-def driver(browser_name):
-    """Create and configure driver based on browser selection"""
-    driver = None
-    
-    if browser_name.lower() == "chrome":
-        chrome_options = ChromeOptions()
-        # Headless mode for CI/CD compatibility
-        chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--window-size=1920,1080")
-        
-        driver = webdriver.Chrome(options=chrome_options)
-        
-    elif browser_name.lower() == "firefox":
-        firefox_options = FirefoxOptions()
-        # Headless mode for CI/CD compatibility
-        firefox_options.add_argument("--headless")
-        firefox_options.add_argument("--width=1920")
-        firefox_options.add_argument("--height=1080")
-        
-        driver = webdriver.Firefox(options=firefox_options)
-    
+def driver(request, browser_name):
+    """Create or borrow a driver based on browser and driver mode selection"""
+    pooled = request.config.getoption("--driver-mode") == "pooled"
+
+    if pooled:
+        pool = request.getfixturevalue("driver_pool")
+        driver = pool.acquire()
     else:
-        raise ValueError(f"Unsupported browser: {browser_name}")
-    
-    driver.implicitly_wait(10)
+        driver = create_driver(browser_name)
     
     # Add browser name to Allure environment
     allure.attach(browser_name, name="Browser", attachment_type=allure.attachment_type.TEXT)
     
     yield driver
-    driver.quit()
+
+    if pooled:
+        pool.release(driver)
+    else:
+        driver.quit()
+
+
+@pytest.fixture
+def screenshots_dir(request):
+    """Screenshot directory for this worker"""
+    return worker_dir("screenshots", get_worker_id(request.config))
+
+
+@pytest.fixture
+def download_dir(request):
+    """Empty download directory unique to this worker and test"""
+    base = worker_dir("downloads", get_worker_id(request.config))
+    path = tempfile.mkdtemp(dir=base)
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
 
 
 @pytest.fixture
@@ -92,11 +148,8 @@ def pytest_runtest_makereport(item, call):
         
         if driver:
             try:
-                # Create screenshots directory
-                screenshots_dir = "screenshots"
-                if not os.path.exists(screenshots_dir):
-                    os.makedirs(screenshots_dir)
-                    print(f"\n📁 Created directory: {screenshots_dir}")
+                # Create screenshots directory (one sub-directory per xdist worker)
+                screenshots_dir = worker_dir("screenshots", get_worker_id(item.config))
                 
                 # Generate screenshot filename
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -2,7 +2,6 @@
 """Complete test suite using Page Object Model"""
 import pytest
 import os
-import tempfile
 import time
 import allure
 from datetime import datetime
@@ -187,9 +186,8 @@ class TestFileDownload:
     #    os.getenv('CI') == 'true',
     #    reason="File downloads are unreliable in CI/CD headless Chrome environment"
     #)
-    def test_file_download(self, base_url):
+    def test_file_download(self, base_url, download_dir, screenshots_dir):
         """Test file download functionality"""
-        download_dir = tempfile.mkdtemp()
         
         # Configure Chrome with download preferences
         chrome_options = webdriver.ChromeOptions()
@@ -315,8 +313,7 @@ class TestFileDownload:
             
             # Try to capture screenshot even though driver is separate
             try:
-                screenshot_path = os.path.join("screenshots", f"download_failure_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png")
-                os.makedirs("screenshots", exist_ok=True)
+                screenshot_path = os.path.join(screenshots_dir, f"download_failure_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png")
                 download_driver.save_screenshot(screenshot_path)
                 
                 # Attach to Allure
@@ -333,17 +330,6 @@ class TestFileDownload:
                 download_driver.quit()
             except Exception as e:
                 print(f"Driver quit warning: {e}")
-            
-            # Clean up files
-            try:
-                if os.path.exists(download_dir):
-                    for file in os.listdir(download_dir):
-                        file_path = os.path.join(download_dir, file)
-                        if os.path.isfile(file_path):
-                            os.remove(file_path)
-                    os.rmdir(download_dir)
-            except Exception as e:
-                print(f"Cleanup warning: {e}")
 
 @allure.feature("File Operations")
 @allure.story("File Upload")
@@ -360,10 +346,11 @@ class TestFileUpload:
     @allure.description("Test file upload functionality and verify the upload")
     @allure.severity(allure.severity_level.NORMAL)
     @pytest.mark.upload
-    def test_file_upload(self):
+    def test_file_upload(self, tmp_path):
         with allure.step("Make the file name and file path"):
+            # tmp_path is unique per test and per xdist worker
             file_name = "test_upload.txt"
-            file_path = os.path.join(os.getcwd(), file_name)
+            file_path = str(tmp_path / file_name)
         
         with allure.step("Create test file"):
             with open(file_path, 'w') as f:
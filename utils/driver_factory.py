@@ -0,0 +1,34 @@
+"""WebDriver factory shared by the driver fixture, the driver pool and benchmarks"""
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+from config import Config
+
+
+def create_driver(browser_name):
+    """Launch a new headless browser for the given browser name"""
+    if browser_name.lower() == "chrome":
+        chrome_options = ChromeOptions()
+        # Headless mode for CI/CD compatibility
+        chrome_options.add_argument("--headless=new")
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--window-size=1920,1080")
+
+        driver = webdriver.Chrome(options=chrome_options)
+
+    elif browser_name.lower() == "firefox":
+        firefox_options = FirefoxOptions()
+        # Headless mode for CI/CD compatibility
+        firefox_options.add_argument("--headless")
+        firefox_options.add_argument("--width=1920")
+        firefox_options.add_argument("--height=1080")
+
+        driver = webdriver.Firefox(options=firefox_options)
+
+    else:
+        raise ValueError(f"Unsupported browser: {browser_name}")
+
+    driver.implicitly_wait(Config.TIMEOUT)
+    return driver
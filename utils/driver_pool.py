@@ -0,0 +1,103 @@
+"""Pool of warm browsers that are reset between tests instead of relaunched"""
+import threading
+from selenium.common.exceptions import NoAlertPresentException, WebDriverException
+
+CLEAR_STORAGE_SCRIPT = """
+try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+"""
+
+
+class DriverPool:
+    """Hand out warm drivers and reset them on release.
+
+    A driver whose reset fails is quit and dropped, so the next
+    acquire() falls back to launching a fresh browser.
+    """
+
+    def __init__(self, factory, max_idle=1):
+        self.factory = factory
+        self.max_idle = max_idle
+        self._idle = []
+        self._home_handles = {}
+        self._lock = threading.Lock()
+        self.stats = {"launched": 0, "reused": 0, "reset_failures": 0}
+
+    def acquire(self):
+        """Return an idle driver, or launch a new one if none is available"""
+        with self._lock:
+            if self._idle:
+                self.stats["reused"] += 1
+                return self._idle.pop()
+            self.stats["launched"] += 1
+
+        driver = self.factory()
+        self._home_handles[id(driver)] = driver.current_window_handle
+        return driver
+
+    def release(self, driver):
+        """Reset the driver and return it to the pool, or quit it if reset fails"""
+        if self.reset(driver):
+            with self._lock:
+                if len(self._idle) < self.max_idle:
+                    self._idle.append(driver)
+                    return
+        else:
+            self.stats["reset_failures"] += 1
+        self._discard(driver)
+
+    def reset(self, driver):
+        """Bring the browser back to a blank state, return True on success"""
+        try:
+            self._dismiss_alerts(driver)
+            self._close_extra_windows(driver)
+            self._dismiss_alerts(driver)
+            driver.execute_script(CLEAR_STORAGE_SCRIPT)
+            self._clear_cookies(driver)
+            driver.get("about:blank")
+            return True
+        except WebDriverException:
+            return False
+
+    def close(self):
+        """Quit every idle driver"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for driver in idle:
+            self._discard(driver)
+
+    def _discard(self, driver):
+        self._home_handles.pop(id(driver), None)
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+    def _dismiss_alerts(self, driver, limit=5):
+        """Dismiss alerts left open by the test (e.g. context menu, A/B test)"""
+        for _ in range(limit):
+            try:
+                driver.switch_to.alert.dismiss()
+            except NoAlertPresentException:
+                return
+
+    def _close_extra_windows(self, driver):
+        """Close windows opened during the test and switch back to the first one"""
+        handles = driver.window_handles
+        home = self._home_handles.get(id(driver))
+        if home not in handles:
+            home = handles[0]
+            self._home_handles[id(driver)] = home
+
+        for handle in handles:
+            if handle != home:
+                driver.switch_to.window(handle)
+                driver.close()
+        driver.switch_to.window(home)
+
+    def _clear_cookies(self, driver):
+        """Clear cookies for every domain, not only the current one"""
+        if hasattr(driver, "execute_cdp_cmd"):
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        else:
+            driver.delete_all_cookies()
@@ -0,0 +1,43 @@
+"""Helpers for running the suite across pytest-xdist worker processes"""
+import os
+import shutil
+
+CONTROLLER_ID = "master"
+
+
+def get_worker_id(config):
+    """Return the xdist worker id (gw0, gw1, ...) or 'master' when not distributed"""
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is None:
+        return CONTROLLER_ID
+    return workerinput["workerid"]
+
+
+def is_worker(config):
+    """True inside an xdist worker process"""
+    return hasattr(config, "workerinput")
+
+
+def worker_dir(base_dir, worker_id):
+    """Per-worker sub-directory of base_dir so workers never share files"""
+    path = base_dir if worker_id == CONTROLLER_ID else os.path.join(base_dir, worker_id)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def merge_worker_results(report_dir):
+    """Move result files written by each worker sub-directory into report_dir"""
+    if not os.path.isdir(report_dir):
+        return 0
+
+    merged = 0
+    for entry in os.listdir(report_dir):
+        sub_dir = os.path.join(report_dir, entry)
+        if not (entry.startswith("gw") and os.path.isdir(sub_dir)):
+            continue
+        for file_name in os.listdir(sub_dir):
+            # Allure names every result file with a uuid, so names never clash
+            os.replace(os.path.join(sub_dir, file_name), os.path.join(report_dir, file_name))
+            merged += 1
+        shutil.rmtree(sub_dir, ignore_errors=True)
+    return merged